@@ -1,17 +1,22 @@
 import goupil
 import numpy
+import pickle
 import pytest
 
 
 def test_AtomicElement():
     """Test usage of an AtomicElement."""
 
-    # Check constructor from Z.
-    for z in range(1, 101):
-        element = goupil.AtomicElement(z)
+    # Check elements from Z, in a single batch.
+    elements = goupil.elements(*range(1, 101))
+    for z, element in enumerate(elements, 1):
         assert element.Z == z
         assert (element.A > 0.0) and (element.A != z)
 
+    # Check constructor from Z.
+    for z in (1, 100):
+        assert goupil.AtomicElement(z) == elements[z - 1]
+
     # Check out of range values.
     for z in (0, 119):
         with pytest.raises(RuntimeError) as e:
@@ -42,6 +47,17 @@ def test_AtomicElement():
             setattr(H0, attr, None)
         assert "not writable" in str(e.value)
 
+    # Check shared instances.
+    assert goupil.elements("H") is goupil.elements("H")
+    with pytest.raises(TypeError) as e:
+        goupil.elements("H").__setstate__(goupil.elements("U").__getstate__())
+    assert str(e.value) == "bad operation (atomic element 'H' is immutable)"
+    assert goupil.elements("H").symbol == "H"
+
+    # Check pickling.
+    U = goupil.elements("U")
+    assert pickle.loads(pickle.dumps(U)) == U
+
 
 def test_ComptonProcess():
     """Test usage of a ComptonProcess."""
@@ -95,6 +111,19 @@ def test_ComptonProcess():
     assert values.shape == energies.shape
     assert (numpy.diff(values) < 0.0).all()
 
+    # Check that vectorised cross-sections match scalar ones.
+    for model in ("Klein-Nishina", "Penelope", "Scattering Function"):
+        for mode in (None, "Adjoint", "Direct", "Inverse"):
+            process = goupil.ComptonProcess(model=model)
+            process.mode = mode
+            for x in (energies, energies[::2]):
+                values = process.cross_section(x, material)
+                expected = numpy.array(
+                    [process.cross_section(xi, material) for xi in x]
+                )
+                assert values.shape == x.shape
+                assert (values == expected).all()
+
 
 def test_MaterialDefinition():
     """Test usage of a MaterialDefinition."""
@@ -112,6 +141,20 @@ def test_MaterialDefinition():
     H, O = goupil.elements("H, O")
     assert H2O.mass == 2 * H.A + O.A
 
+    # Check cached compositions.
+    assert H2O.mass_composition is H2O.mass_composition
+    assert H2O.mole_composition is H2O.mole_composition
+
+    copy = pickle.loads(pickle.dumps(H2O))
+    assert copy == H2O
+    assert copy.mole_composition == H2O.mole_composition
+    assert copy.mole_composition is copy.mole_composition
+
+    CO2 = goupil.MaterialDefinition("CO2")
+    copy.__setstate__(CO2.__getstate__())
+    assert copy.mass_composition == CO2.mass_composition
+    assert copy.mole_composition == CO2.mole_composition
+
     nothing = goupil.MaterialDefinition()
     assert nothing.mass == 0.0
 
@@ -161,3 +204,43 @@ def test_MaterialRecord():
     # Check table getters.
     table = record.absorption_cross_section()
     assert(isinstance(table, goupil.CrossSection))
+
+
+def test_RandomStream():
+    """Test usage of a RandomStream."""
+
+    # Check output buffers.
+    stream = goupil.RandomStream(0)
+    buffer = numpy.zeros(4)
+    assert stream.uniform01(out=buffer) is buffer
+    assert (buffer > 0).all() and (buffer < 1).all()
+
+    buffer = numpy.zeros(8)
+    view = buffer[::2]
+    assert stream.normal(out=view) is view
+    assert (buffer[::2] != 0).all()
+    assert (buffer[1::2] == 0).all()
+
+    # Check that a read-only buffer is rejected before drawing.
+    buffer = numpy.empty(3)
+    buffer.flags.writeable = False
+    index = stream.index
+    with pytest.raises(ValueError) as e:
+        stream.uniform01(out=buffer)
+    assert str(e.value) == "assignment destination is read-only"
+    assert stream.index == index
+
+    # Check shape mismatches.
+    with pytest.raises(ValueError):
+        stream.uniform01(4, out=numpy.empty(3))
+    assert stream.index == index
+    with pytest.raises(ValueError):
+        stream.uniform01(6, out=numpy.empty((2, 3)))
+    assert stream.index == index
+
+    # Check multi-dimensional shapes.
+    n = 5
+    assert stream.uniform01((n, 2)).shape == (n, 2)
+    assert stream.normal((n, 2)).shape == (n, 2)
+    buffer = numpy.empty((n, 2))
+    assert stream.uniform01((n, 2), out=buffer) is buffer
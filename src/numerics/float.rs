@@ -56,7 +56,7 @@ impl Float3 {
     pub fn rotate(&mut self, cos_theta: Float, phi: Float) {
         // Compute (and check) the sine.
         let sin_theta = {
-            let stsq = 1.0 - cos_theta * cos_theta;
+            let stsq = (1.0 - cos_theta) * (1.0 + cos_theta);
             if stsq < 0.0 { return }
             stsq.sqrt()
         };
@@ -91,8 +91,9 @@ impl Float3 {
         let u1 = u0.cross(direction);
 
         // Apply the rotation.
+        let (sin_phi, cos_phi) = phi.sin_cos();
         *self = (norm * cos_theta) * direction +
-                (norm * sin_theta) * (phi.cos() * u0 + phi.sin() * u1);
+                (norm * sin_theta) * (cos_phi * u0 + sin_phi * u1);
     }
 }
 
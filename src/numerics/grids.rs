@@ -241,19 +241,17 @@ impl Grid for UnstructuredGrid {
     fn len(&self) -> usize { self.0.len() }
 
     fn transform(&self, x: Float) -> GridCoordinate {
-        let mut i0 = 0;
-        if x < self.0[i0] { return GridCoordinate::Below }
-        let mut i1 = self.0.len() - 1;
-        if x > self.0[i1] { return GridCoordinate::Above(self.0.len()) }
-        else if x == self.0[i1] { return GridCoordinate::Inside(i1 - 1, 1.0) }
-        while i1 > i0 + 1 {
-            let i2 = (i0 + i1) / 2;
-            if x < self.0[i2] {
-                i1 = i2;
-            } else {
-                i0 = i2;
-            }
-        }
+        if x < self.0[0] { return GridCoordinate::Below }
+        let n = self.0.len() - 1;
+        if x > self.0[n] { return GridCoordinate::Above(self.0.len()) }
+        else if x == self.0[n] { return GridCoordinate::Inside(n - 1, 1.0) }
+        // Index of the first node above x, using std's (branchless) binary search. Note that a
+        // NaN value falls through to the last segment, as for other grids.
+        let i1 = match self.0.partition_point(|xi| *xi <= x) {
+            0 => n,
+            i1 => i1,
+        };
+        let i0 = i1 - 1;
         let x0 = self.0[i0];
         let t = (x - x0) / (self.0[i1] - x0);
         GridCoordinate::Inside(i0, t)
@@ -281,5 +279,21 @@ mod tests {
         assert_eq!(grid.transform(0.0).clamp(), (0, 0.0));
         assert_eq!(grid.transform(15.0).clamp(), (2, 1.0));
         assert_eq!(grid.transform(5.0).clamp(), (1, 0.5));
+
+        // Check NaN values.
+        match grid.transform(Float::NAN) {
+            GridCoordinate::Inside(i, t) => {
+                assert_eq!(i, 2);
+                assert!(t.is_nan());
+            },
+            _ => unreachable!(),
+        }
+
+        // Check repeated nodes (e.g. absorption edges).
+        let grid = UnstructuredGrid::from([1.0, 3.0, 3.0, 7.0, 15.0]);
+        assert_eq!(grid.transform(2.0).clamp(), (0, 0.5));
+        assert_eq!(grid.transform(3.0).clamp(), (2, 0.0));
+        assert_eq!(grid.transform(5.0).clamp(), (2, 0.5));
+        assert_eq!(grid.transform(15.0).clamp(), (3, 1.0));
     }
 }
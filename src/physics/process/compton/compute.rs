@@ -60,6 +60,34 @@ impl ComptonComputer {
         Ok(result)
     }
 
+    // Compute the (restricted) cross-section for a batch of energies, in cm^2.
+    //
+    // The energies are overwritten in-place with the corresponding cross-section values. For the
+    // Klein-Nishina model, the free cross-section is computed per value as for `cross_section`,
+    // but without polling for Ctrl+C.
+    pub fn cross_sections(&self, values: &mut [Float], energy_min: Option<Float>,
+        energy_max: Option<Float>, electrons: &ElectronicStructure) -> Result<()> {
+
+        match self.mode {
+            ComptonMode::None => values.fill(0.0),
+            _ => match self.model {
+                KleinNishina => {
+                    let charge = electrons.charge();
+                    for value in values.iter_mut() {
+                        *value = charge * self.free_cross_section(
+                            self.mode, *value, energy_min, energy_max);
+                    }
+                },
+                ScatteringFunction | Penelope => {
+                    for value in values.iter_mut() {
+                        *value = self.cross_section(*value, energy_min, energy_max, electrons)?;
+                    }
+                },
+            },
+        }
+        Ok(())
+    }
+
     // Compute the differential cross-section w.r.t. outgoing energy, in cm^2 / MeV.
     pub fn dcs(&self, energy_in: Float, energy_out: Float, electrons: &ElectronicStructure)
         -> Float {
@@ -114,7 +142,8 @@ impl ComptonComputer {
                 Inverse | Direct => {
                     let tmp0 = 1.0 + 2.0 * x;
                     let tmp1 = 1.0 / x;
-                    Self::CS_FACTOR / x * ((1.0 - 2.0 * tmp1 - 2.0 * tmp1 * tmp1) * tmp0.ln() +
+                    Self::CS_FACTOR / x * ((1.0 - 2.0 * tmp1 - 2.0 * tmp1 * tmp1) *
+                        (2.0 * x).ln_1p() +
                         0.5 + 4.0 * tmp1 - 0.5 / (tmp0 * tmp0))
                 },
                 ComptonMode::None => unreachable!(),
@@ -257,3 +286,32 @@ impl ComptonComputer {
             self.effective_charge(energy_in, energy_out, electrons)
     }
 }
+
+
+// ===============================================================================================
+// Unit tests.
+// ===============================================================================================
+#[cfg(test)]
+mod tests {
+    use crate::numerics::tests::assert_float_eq;
+    use super::*;
+
+    #[cfg(not(feature = "f32"))]
+    #[test]
+    fn free_cross_section() {
+        // Check the total cross-section at low energies against the log(1 + 2x) expression.
+        let computer = ComptonComputer::default();
+        for energy in [1E-03, 1E-02, 1E-01, 1E+00] {
+            let x = energy / ELECTRON_MASS;
+            let tmp0 = 1.0 + 2.0 * x;
+            let tmp1 = 1.0 / x;
+            let expected = ComptonComputer::CS_FACTOR / x *
+                ((1.0 - 2.0 * tmp1 - 2.0 * tmp1 * tmp1) * tmp0.ln() +
+                0.5 + 4.0 * tmp1 - 0.5 / (tmp0 * tmp0));
+            for mode in [Direct, Inverse] {
+                let value = computer.free_cross_section(mode, energy, None, None);
+                assert_float_eq!(value / expected, 1.0, 1E-07);
+            }
+        }
+    }
+}
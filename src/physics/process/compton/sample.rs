@@ -246,15 +246,15 @@ impl ComptonSampler {
         let tmp0 = 1.0 + 2.0 * x0;
         let pa = x0 * tmp0.ln();
         let pb = 2.0 * x0 * x0 * (1.0 + x0) / (tmp0 * tmp0);
+        let r = pa / (pa + pb);
+        let tmp1 = 1.0 / (tmp0 * tmp0);
 
         let generator = |x0: Float, rng: &mut R| -> Float {
             let u = rng.uniform01();
-            let r = pa / (pa + pb);
             if u < r {
                     let v = u / r;
                     x0 * tmp0.powf(-v)
             } else {
-                let tmp1 = 1.0 / (tmp0 * tmp0);
                 let v = (u - r) / (1.0 - r);
                 x0 * (tmp1 + v * (1.0 - tmp1)).sqrt()
             }
@@ -1,12 +1,14 @@
 use anyhow::Result;
 use crate::numerics::float::Float;
-use crate::physics::elements::AtomicElement;
+use crate::physics::elements::{AtomicElement, data::ELEMENTS};
 use pyo3::prelude::*;
 use pyo3::class::basic::CompareOp;
 use pyo3::exceptions::PyNotImplementedError;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::{PyBytes, PyTuple};
 use rmp_serde::{Deserializer, Serializer};
 use serde::{Deserialize, Serialize};
+use super::macros::type_error;
 
 
 // ===============================================================================================
@@ -60,6 +62,11 @@ impl PyAtomicElement {
     }
 
     fn __setstate__(&mut self, state: &PyBytes) -> Result<()> {
+        // Atomic elements might be shared (see `PyAtomicElement::object`). Thus, only
+        // uninitialised objects, e.g. when unpickling, can be set.
+        if !std::ptr::eq(self.0, AtomicElement::none()) {
+            type_error!("bad operation (atomic element '{}' is immutable)", self.0.symbol)
+        }
         self.0 = Deserialize::deserialize(&mut Deserializer::new(state.as_bytes()))?;
         Ok(())
     }
@@ -81,6 +88,26 @@ impl PyAtomicElement {
     }
 }
 
+impl PyAtomicElement {
+    // Returns a shared Python object wrapping an atomic element.
+    //
+    // Python objects are created once for all tabulated elements, and then reused.
+    pub(crate) fn object(py: Python, element: &'static AtomicElement) -> PyObject {
+        static OBJECTS: GILOnceCell<Vec<PyObject>> = GILOnceCell::new();
+        let objects = OBJECTS.get_or_init(py, || {
+            ELEMENTS
+                .iter()
+                .map(|element| Self(element).into_py(py))
+                .collect()
+        });
+        let index = (element.Z - 1) as usize;
+        match ELEMENTS.get(index) {
+            Some(tabulated) if std::ptr::eq(tabulated, element) => objects[index].clone_ref(py),
+            _ => Self(element).into_py(py),
+        }
+    }
+}
+
 #[derive(FromPyObject)]
 enum AtomArg {
     Symbol(String),
@@ -100,13 +127,13 @@ pub fn elements(py: Python, args: &PyTuple) -> Result<PyObject> {
                     .split(",")
                     .map(|s| s.trim());
                 for symbol in symbols {
-                    let element = PyAtomicElement(AtomicElement::from_symbol(symbol)?);
-                    elements.push(element.into_py(py));
+                    let element = AtomicElement::from_symbol(symbol)?;
+                    elements.push(PyAtomicElement::object(py, element));
                 }
             },
             AtomArg::Z(z) => {
-                let element = PyAtomicElement(AtomicElement::from_Z(*z)?);
-                elements.push(element.into_py(py));
+                let element = AtomicElement::from_Z(*z)?;
+                elements.push(PyAtomicElement::object(py, element));
             },
         };
     }
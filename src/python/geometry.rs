@@ -39,7 +39,7 @@ impl PySimpleGeometry {
 
     #[getter]
     fn get_material(&self) -> PyMaterialDefinition {
-        PyMaterialDefinition(self.0.materials[0].clone())
+        PyMaterialDefinition::from(self.0.materials[0].clone())
     }
 }
 
@@ -63,7 +63,7 @@ impl PyExternalGeometry {
     fn get_materials<'p>(&self, py: Python<'p>) -> &'p PyTuple {
         let mut materials = Vec::<PyObject>::with_capacity(self.0.materials.len());
         for material in self.0.materials.iter() {
-            let material = PyMaterialDefinition(material.clone());
+            let material = PyMaterialDefinition::from(material.clone());
             materials.push(material.into_py(py));
         }
         PyTuple::new(py, materials)
@@ -85,6 +85,10 @@ impl PyExternalGeometry {
         PyTuple::new(py, sectors)
     }
 
+    fn sector_index(&self, description: &str) -> Result<usize> {
+        self.0.sector_index(description)
+    }
+
     fn update_material(
         &mut self,
         index: usize,
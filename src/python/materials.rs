@@ -9,6 +9,7 @@ use crate::physics::materials::{
     MaterialDefinition,
     MaterialRecord,
     MaterialRegistry,
+    WeightedElement,
 };
 use crate::physics::process::absorption::{
     AbsorptionMode::{self, Discrete},
@@ -49,7 +50,45 @@ use std::collections::HashMap;
 // ===============================================================================================
 
 #[pyclass(name = "MaterialDefinition", module = "goupil")]
-pub struct PyMaterialDefinition (pub MaterialDefinition);
+pub struct PyMaterialDefinition (pub MaterialDefinition, DefinitionCache);
+
+// Cached properties derived from a material definition.
+struct DefinitionCache {
+    mass: GILOnceCell<Py<PyTuple>>,
+    mole: GILOnceCell<Py<PyTuple>>,
+    electrons: GILOnceCell<ElectronicStructure>,
+}
+
+impl DefinitionCache {
+    fn new() -> Self {
+        Self {
+            mass: GILOnceCell::new(),
+            mole: GILOnceCell::new(),
+            electrons: GILOnceCell::new(),
+        }
+    }
+}
+
+impl From<MaterialDefinition> for PyMaterialDefinition {
+    fn from(definition: MaterialDefinition) -> Self {
+        Self(definition, DefinitionCache::new())
+    }
+}
+
+impl PyMaterialDefinition {
+    // Returns the electronic structure of the material, computed on first access.
+    pub(crate) fn get_electrons(&self, py: Python) -> Result<&ElectronicStructure> {
+        self.1.electrons.get_or_try_init(py, || self.0.compute_electrons())
+    }
+
+    fn new_composition(py: Python, composition: &[WeightedElement]) -> Py<PyTuple> {
+        let composition: Vec<_> = composition
+            .iter()
+            .map(|(weight, element)| (*weight, PyAtomicElement::object(py, *element)))
+            .collect();
+        PyTuple::new(py, composition).into()
+    }
+}
 
 #[derive(FromPyObject)]
 enum Element<'py> {
@@ -151,7 +190,7 @@ impl PyMaterialDefinition {
                 },
             }
         };
-        Ok(Self(definition))
+        Ok(Self::from(definition))
     }
 
     // Implementation of equality test.
@@ -162,6 +201,7 @@ impl PyMaterialDefinition {
     // Implementation of pickling protocol.
     pub fn __setstate__(&mut self, state: &PyBytes) -> Result<()> {
         self.0 = Deserialize::deserialize(&mut Deserializer::new(state.as_bytes()))?;
+        self.1 = DefinitionCache::new();
         Ok(())
     }
 
@@ -182,23 +222,17 @@ impl PyMaterialDefinition {
     }
 
     #[getter]
-    fn get_mass_composition<'p>(&self, py: Python<'p>) -> &'p PyTuple {
-        let composition: Vec<_> = self.0
-            .mass_composition()
-            .iter()
-            .map(|(weight, element)| (*weight, PyAtomicElement(*element).into_py(py)))
-            .collect();
-        PyTuple::new(py, composition)
+    fn get_mass_composition(&self, py: Python) -> Py<PyTuple> {
+        self.1.mass
+            .get_or_init(py, || Self::new_composition(py, self.0.mass_composition()))
+            .clone_ref(py)
     }
 
     #[getter]
-    fn get_mole_composition<'p>(&self, py: Python<'p>) -> &'p PyTuple {
-        let composition: Vec<_> = self.0
-            .mole_composition()
-            .iter()
-            .map(|(weight, element)| (*weight, PyAtomicElement(*element).into_py(py)))
-            .collect();
-        PyTuple::new(py, composition)
+    fn get_mole_composition(&self, py: Python) -> Py<PyTuple> {
+        self.1.mole
+            .get_or_init(py, || Self::new_composition(py, self.0.mole_composition()))
+            .clone_ref(py)
     }
 
     #[getter]
@@ -206,8 +240,8 @@ impl PyMaterialDefinition {
         self.0.name()
     }
 
-    fn electrons(&self) -> Result<PyElectronicStructure> {
-        let electrons = self.0.compute_electrons()?;
+    fn electrons(&self, py: Python) -> Result<PyElectronicStructure> {
+        let electrons = self.get_electrons(py)?.clone();
         PyElectronicStructure::new(electrons, false)
     }
 }
@@ -524,7 +558,7 @@ impl PyMaterialRecord {
     fn get_definition(&mut self, py: Python) -> Result<Py<PyMaterialDefinition>> {
         match &self.definition {
             None => {
-                let definition = PyMaterialDefinition(self.get(py)?.definition().clone());
+                let definition = PyMaterialDefinition::from(self.get(py)?.definition().clone());
                 let definition = Py::new(py, definition)?;
                 self.definition = Some(definition.clone());
                 Ok(definition)
@@ -518,7 +518,7 @@ where
 
 // Private interface.
 impl<T> PyArray<T> {
-    fn is_contiguous(&self) -> PyResult<()> {
+    pub(crate) fn is_contiguous(&self) -> PyResult<()> {
         let obj: &PyArrayObject = self.as_ref();
         if obj.flags & PyArrayFlags::C_CONTIGUOUS == 0 {
             Err(PyValueError::new_err("memory is not C-contiguous"))
@@ -527,7 +527,7 @@ impl<T> PyArray<T> {
         }
     }
 
-    fn is_writeable(&self) -> PyResult<()> {
+    pub(crate) fn is_writeable(&self) -> PyResult<()> {
         let obj: &PyArrayObject = self.as_ref();
         if obj.flags & PyArrayFlags::WRITEABLE == 0 {
             Err(PyValueError::new_err("assignment destination is read-only"))
@@ -782,3 +782,18 @@ pub enum ArrayOrFloat<'a> {
     Array(&'a PyArray<Float>),
     Float(Float),
 }
+
+#[derive(pyo3::FromPyObject)]
+pub enum ShapeArg {
+    Scalar(usize),
+    Vector(Vec<usize>),
+}
+
+impl From<ShapeArg> for Vec<usize> {
+    fn from(value: ShapeArg) -> Self {
+        match value {
+            ShapeArg::Scalar(value) => vec![value],
+            ShapeArg::Vector(value) => value,
+        }
+    }
+}
@@ -13,7 +13,6 @@ use crate::physics::process::rayleigh::{RayleighMode, sample::RayleighSampler};
 use pyo3::prelude::*;
 use pyo3::exceptions::PyTypeError;
 use pyo3::types::PyDict;
-use std::borrow::Cow;
 use super::macros::{key_error, not_implemented_error, value_error};
 use super::materials::{PyMaterialDefinition, PyMaterialRecord};
 use super::numpy::{ArrayOrFloat, PyArray};
@@ -201,16 +200,19 @@ impl PyComptonProcess {
         let result: PyObject = match energy {
             ArrayOrFloat::Array(energy) => {
                 let result = PyArray::<Float>::empty(py, &energy.shape())?;
-                let n = energy.size();
-                for i in 0..n {
-                    let v = self.computer.cross_section(
-                        energy.get(i)?,
-                        energy_min,
-                        energy_max,
-                        &electrons,
-                    )?;
-                    result.set(i, v)?;
+                let values = unsafe { result.slice_mut()? };
+                match unsafe { energy.slice() } {
+                    Ok(energy) => values.copy_from_slice(energy),
+                    Err(_) => for (i, value) in values.iter_mut().enumerate() {
+                        *value = energy.get(i)?;
+                    },
                 }
+                self.computer.cross_sections(
+                    values,
+                    energy_min,
+                    energy_max,
+                    &electrons,
+                )?;
                 result.into_py(py)
             },
             ArrayOrFloat::Float(energy) => {
@@ -306,19 +308,28 @@ impl PyComptonProcess {
                 let energy_out = PyArray::<Float>::empty(py, &energy.shape())?;
                 let cos_theta = PyArray::<Float>::empty(py, &energy.shape())?;
                 let weight = PyArray::<Float>::empty(py, &energy.shape())?;
-                let n = energy.size();
-                for i in 0..n {
-                    let momentum_in = Float3::new(0.0, 0.0, energy.get(i)?);
-                    let sample = self.sampler.sample(
-                        &mut rng.generator,
-                        momentum_in,
-                        material,
-                        None,
-                    )?;
-                    let e = sample.momentum_out.norm();
-                    energy_out.set(i, e)?;
-                    cos_theta.set(i, sample.momentum_out.2 / e)?;
-                    weight.set(i, sample.weight)?;
+                {
+                    let energy_out = unsafe { energy_out.slice_mut()? };
+                    let cos_theta = unsafe { cos_theta.slice_mut()? };
+                    let weight = unsafe { weight.slice_mut()? };
+                    let energy_in = unsafe { energy.slice() }.ok();
+                    for i in 0..energy_out.len() {
+                        let energy_in = match energy_in {
+                            Some(energy_in) => energy_in[i],
+                            None => energy.get(i)?,
+                        };
+                        let momentum_in = Float3::new(0.0, 0.0, energy_in);
+                        let sample = self.sampler.sample(
+                            &mut rng.generator,
+                            momentum_in,
+                            material,
+                            None,
+                        )?;
+                        let e = sample.momentum_out.norm();
+                        energy_out[i] = e;
+                        cos_theta[i] = sample.momentum_out.2 / e;
+                        weight[i] = sample.weight;
+                    }
                 }
                 let energy_out: PyObject = energy_out.into_py(py);
                 let cos_theta: PyObject = cos_theta.into_py(py);
@@ -350,21 +361,17 @@ enum Material<'py> {
 }
 
 impl<'py> Material<'py> {
-    fn get_electrons(&self) -> Result<Cow<'py, ElectronicStructure>> {
+    fn get_electrons(&self) -> Result<&ElectronicStructure> {
         let electrons = match self {
-            Material::Definition(material) => {
-                let electrons = material.0.compute_electrons()?;
-                Cow::Owned(electrons)
-            },
+            Material::Definition(material) => material.get_electrons(material.py())?,
             Material::Record(material) => {
                 let py = material.py();
-                let electrons = material.get(py)?
+                material.get(py)?
                     .electrons()
                     .ok_or_else(|| PyTypeError::new_err(
                         "missing electronic structure (expected Some(ElectronicStructure), 
                             found None)"
-                    ))?;
-                Cow::Borrowed(electrons)
+                    ))?
             },
         };
         Ok(electrons)
@@ -4,7 +4,8 @@ use getrandom::getrandom;
 use pyo3::prelude::*;
 use rand::SeedableRng;
 use serde_derive::{Deserialize, Serialize};
-use super::numpy::{PyArray, PyScalar};
+use super::macros::value_error;
+use super::numpy::{PyArray, PyScalar, ShapeArg};
 
 #[cfg(not(feature = "f32"))]
 use rand_pcg::Pcg64Mcg as Generator;
@@ -63,15 +64,25 @@ impl PyRandomStream {
     }
 
     /// Generates pseudo random number(s) following the Normal law.
-    #[pyo3(name = "normal")]
-    fn py_normal(&mut self, py: Python, n: Option<usize>) -> Result<PyObject> {
-        self.generate(py, n, Self::normal)
+    #[pyo3(name = "normal", signature = (n=None, *, out=None))]
+    fn py_normal(
+        &mut self,
+        py: Python,
+        n: Option<ShapeArg>,
+        out: Option<&PyArray<Float>>,
+    ) -> Result<PyObject> {
+        self.generate(py, n, out, Self::normal)
     }
 
     /// Generates pseudo random number(s) uniformly distributed over (0,1).
-    #[pyo3(name = "uniform01")]
-    fn py_uniform01(&mut self, py: Python, n: Option<usize>) -> Result<PyObject> {
-        self.generate(py, n, Self::uniform01)
+    #[pyo3(name = "uniform01", signature = (n=None, *, out=None))]
+    fn py_uniform01(
+        &mut self,
+        py: Python,
+        n: Option<ShapeArg>,
+        out: Option<&PyArray<Float>>,
+    ) -> Result<PyObject> {
+        self.generate(py, n, out, Self::uniform01)
     }
 }
 
@@ -106,18 +117,49 @@ impl PyRandomStream {
     fn generate(
         &mut self,
         py: Python,
-        n: Option<usize>,
+        shape: Option<ShapeArg>,
+        out: Option<&PyArray<Float>>,
         func: fn(&mut Self) -> Float
     ) -> Result<PyObject> {
-        match n {
+        let shape: Option<Vec<usize>> = shape.map(|shape| shape.into());
+        if let Some(out) = out {
+            // Fill the provided buffer in-place.
+            let size = out.size();
+            if let Some(shape) = shape.as_ref() {
+                if *shape != out.shape() {
+                    value_error!(
+                        "bad shape (expected {:?}, found {:?})",
+                        out.shape(),
+                        shape,
+                    )
+                }
+            }
+            out.is_writeable()?;
+            match out.is_contiguous() {
+                Ok(_) => {
+                    let values = unsafe { out.slice_mut()? };
+                    for value in values.iter_mut() {
+                        *value = func(self);
+                    }
+                },
+                Err(_) => for i in 0..size {
+                    out.set(i, func(self))?;
+                },
+            }
+            let array: &PyAny = out;
+            return Ok(array.into())
+        }
+
+        match shape {
             None => {
                 let value = func(self);
                 let scalar = PyScalar::new(py, value)?;
                 Ok(scalar.into())
             },
-            Some(n) => {
+            Some(shape) => {
+                let n: usize = shape.iter().product();
                 let iter = (0..n).map(|_| func(self));
-                let array: &PyAny = PyArray::<Float>::from_iter(py, &[n], iter)?;
+                let array: &PyAny = PyArray::<Float>::from_iter(py, &shape, iter)?;
                 Ok(array.into())
             },
         }
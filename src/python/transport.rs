@@ -24,7 +24,7 @@ use super::{
     geometry::{PyExternalGeometry, PyGeometryDefinition},
     macros::type_error,
     materials::PyMaterialRegistry,
-    numpy::{Dtype, PyArray, PyScalar},
+    numpy::{Dtype, PyArray, PyScalar, ShapeArg},
     rand::PyRandomStream,
     prefix,
 };
@@ -581,21 +581,6 @@ impl PyPhotonState {
     }
 }
 
-#[derive(FromPyObject)]
-pub enum ShapeArg {
-    Scalar(usize),
-    Vector(Vec<usize>),
-}
-
-impl From<ShapeArg> for Vec<usize> {
-    fn from(value: ShapeArg) -> Self {
-        match value {
-            ShapeArg::Scalar(value) => vec![value],
-            ShapeArg::Vector(value) => value,
-        }
-    }
-}
-
 
 // ===============================================================================================
 // Python class forwarding transport status codes.
@@ -5,6 +5,7 @@ use crate::physics::elements::AtomicElement;
 use crate::physics::materials::{MaterialDefinition, WeightedElement};
 use crate::transport::density::DensityModel;
 use libloading::Library;
+use std::collections::HashMap;
 use std::ffi::{c_int, CStr, OsStr};
 use std::fmt::Display;
 use super::{GeometryDefinition, GeometrySector, GeometryTracer};
@@ -21,6 +22,7 @@ pub struct ExternalGeometry {
     ptr: *mut CGeometry,
     pub(crate) materials: Vec<MaterialDefinition>,
     pub(crate) sectors: Vec<GeometrySector>,
+    sectors_index: HashMap<String, usize>,
 }
 
 #[repr(C)]
@@ -87,6 +89,14 @@ impl ExternalGeometry {
             sectors.push(sector);
         }
 
+        // Map sectors descriptions to indices (keeping the first occurence, if duplicated).
+        let mut sectors_index = HashMap::<String, usize>::with_capacity(size);
+        for (i, sector) in sectors.iter().enumerate() {
+            if let Some(description) = sector.description.as_ref() {
+                sectors_index.entry(description.clone()).or_insert(i);
+            }
+        }
+
         // Bundle the geometry definition.
         let geometry = Self {
             lib: library,
@@ -94,10 +104,21 @@ impl ExternalGeometry {
             ptr: geometry_ptr,
             materials,
             sectors,
+            sectors_index,
         };
         Ok(geometry)
     }
 
+    pub fn sector_index(&self, description: &str) -> Result<usize> {
+        self.sectors_index
+            .get(description)
+            .copied()
+            .ok_or_else(|| anyhow!(
+                "no such sector '{}'",
+                description,
+            ))
+    }
+
     pub fn update_material(
         &mut self,
         index: usize,